@@ -0,0 +1,80 @@
+"""
+Column-wise ROI and valuation index calculation for the stock analyzer.
+
+Uses a Numba-compiled kernel when numba is installed and falls back to
+plain NumPy array expressions otherwise. Both paths give identical results.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _metrics_kernel(koers, eps, dividend, groei_percentage, risico, roi, valuatie_index):
+        """Fill roi and valuatie_index in a single parallel pass over the rows."""
+        for i in prange(koers.shape[0]):
+            k = koers[i]
+            r = ((eps[i] + dividend[i]) / k) * 100.0 if k > 0 else 0.0
+            roi[i] = r
+            valuatie_index[i] = (r * groei_percentage[i]) / risico[i] if risico[i] > 0 else 0.0
+
+
+def _as_kernel_input(values: np.ndarray) -> np.ndarray:
+    """
+    Return values as a contiguous, read-only float64 array.
+    
+    Numba compiles one kernel per array type, writeability included; pandas
+    hands out read-only column arrays, so all inputs are made to match those.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64).view()
+    values.flags.writeable = False
+    return values
+
+
+if HAVE_NUMBA:
+    # Compile (or load from the on-disk cache) the one signature in use at
+    # import, not on first use
+    _warmup = _as_kernel_input(np.ones(1))
+    _metrics_kernel(_warmup, _warmup, _warmup, _warmup, _warmup, np.empty(1), np.empty(1))
+    del _warmup
+
+
+def compute_metrics(koers: np.ndarray, eps: np.ndarray, dividend: np.ndarray,
+                    groei_percentage: np.ndarray,
+                    risico: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized counterpart of Stock.calculate_metrics for whole columns.
+
+    Division by a non-positive price or risk yields 0.0, as in the scalar version.
+
+    Returns:
+        Tuple of (roi, valuatie_index) arrays
+    """
+    if HAVE_NUMBA:
+        roi = np.empty(len(koers))
+        valuatie_index = np.empty(len(koers))
+        _metrics_kernel(*map(_as_kernel_input, (koers, eps, dividend, groei_percentage, risico)),
+                        roi, valuatie_index)
+        return roi, valuatie_index
+    return _compute_metrics_numpy(koers, eps, dividend, groei_percentage, risico)
+
+
+def _compute_metrics_numpy(koers: np.ndarray, eps: np.ndarray, dividend: np.ndarray,
+                           groei_percentage: np.ndarray,
+                           risico: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Plain NumPy version of compute_metrics, used when numba is not installed."""
+    roi = np.zeros_like(koers)
+    np.divide(eps + dividend, koers, out=roi, where=koers > 0)
+    roi *= 100
+
+    valuatie_index = np.zeros_like(roi)
+    np.divide(roi * groei_percentage, risico, out=valuatie_index, where=risico > 0)
+    return roi, valuatie_index
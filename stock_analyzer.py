@@ -16,12 +16,26 @@ Features:
 import csv
 import sys
 import os
+from collections import OrderedDict
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 
-@dataclass
+from _metrics import compute_metrics
+
+# pyarrow's CSV reader parses blocks on multiple threads; use it when available
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+
+@dataclass(slots=True)
 class Stock:
     """Represents a stock with its financial metrics."""
     bedrijf: str  # Company name (Dutch: bedrijf)
@@ -33,8 +47,8 @@ class Stock:
     risico: float = 0.0  # Risk score (Dutch: risico)
     
     # Calculated fields
-    roi: float = field(default=0.0)  # Return on Investment
-    valuatie_index: float = field(default=0.0)  # Valuation index (Dutch: valuatie_index)
+    roi: float = 0.0  # Return on Investment
+    valuatie_index: float = 0.0  # Valuation index (Dutch: valuatie_index)
     
     def calculate_metrics(self) -> None:
         """
@@ -71,6 +85,137 @@ class Stock:
         }
 
 
+# CSV column order, shared by the analyzer's DataFrame and the CSV export
+CSV_COLUMNS: List[str] = [
+    'bedrijf', 'sector', 'koers', 'winst_per_aandeel', 'dividend',
+    'groei_percentage', 'risico', 'roi', 'valuatie_index'
+]
+NUMERIC_COLUMNS: Tuple[str, ...] = (
+    'koers', 'winst_per_aandeel', 'dividend', 'groei_percentage', 'risico'
+)
+CSV_DEFAULTS: Dict[str, object] = {
+    'bedrijf': '',
+    'sector': '',
+    'dividend': 0.0,
+    'groei_percentage': 0.0,
+    'risico': 1.0,
+}
+
+# Number of filter_indices results kept per analyzer, least recently used dropped first
+FILTER_CACHE_SIZE = 8
+
+# Table layout shared by generate_report and the interactive show_all listing
+_REPORT_HEADER = (f"{'Company':<15} {'Sector':<15} {'Price':<10} {'EPS':<10} {'ROI %':<10} "
+                  f"{'Growth %':<10} {'Risk':<8} {'Valuation':<12}")
+_REPORT_ROW_FMT = "%-15s %-15s %-10.2f %-10.2f %-10.2f %-10.2f %-8.2f %-12.2f"
+_REPORT_COLUMNS = ('bedrijf', 'sector', 'koers', 'winst_per_aandeel', 'roi',
+                   'groei_percentage', 'risico', 'valuatie_index')
+
+
+def _prepare_frame(df: pd.DataFrame, drop_below_index: Optional[float] = None) -> pd.DataFrame:
+    """
+    Clean freshly parsed CSV rows, optionally dropping low-valuation stocks.
+    
+    Works on a whole file or on one chunk of it; the index must hold the
+    0-based data row numbers for the warnings.
+    
+    Args:
+        df: Rows as returned by pd.read_csv
+        drop_below_index: Also drop rows with a lower valuation index
+        
+    Returns:
+        DataFrame with the input columns of CSV_COLUMNS, plus the metric
+        columns if drop_below_index is given
+    """
+    # Header names may carry whitespace; strip them once per frame
+    df.columns = df.columns.str.strip()
+    
+    # Optional columns fall back to their defaults when absent or empty
+    for name, default in CSV_DEFAULTS.items():
+        if name not in df.columns:
+            df[name] = default
+    
+    # Columns are read as text; coerce the numeric ones in bulk and drop rows
+    # whose values do not parse (empty cells fall back to the defaults below,
+    # except for the required EPS)
+    unparsed = np.zeros(len(df), dtype=bool)
+    for name in NUMERIC_COLUMNS:
+        raw = df[name]
+        values = pd.to_numeric(raw, errors='coerce')
+        # Only cells that failed to convert need the (per-cell) blank check
+        failed = values.isna().to_numpy()
+        if failed.any():
+            cells = raw[failed]
+            unparsed[failed] |= (cells.notna() & cells.astype(str).str.strip().ne('')).to_numpy()
+        df[name] = values.astype(np.float64)
+    unparsed |= df['winst_per_aandeel'].isna().to_numpy()
+    for row_num in df.index[unparsed] + 2:
+        print(f"Warning: Row {row_num}: Failed to parse stock data", file=sys.stderr)
+    df = df.loc[~unparsed].fillna(CSV_DEFAULTS)
+    
+    # Text values may still carry surrounding whitespace
+    df['bedrijf'] = df['bedrijf'].astype(str).str.strip()
+    df['sector'] = df['sector'].astype(str).str.strip()
+    
+    # Validate data
+    invalid = df['koers'].isna() | (df['koers'] <= 0)
+    for row_num, bedrijf in zip(df.index[invalid] + 2, df.loc[invalid, 'bedrijf']):
+        print(f"Warning: Row {row_num}: Stock '{bedrijf}' has invalid price", file=sys.stderr)
+    df = df.loc[~invalid]
+    
+    # Metrics are computed lazily by the analyzer, unless needed for filtering now
+    if drop_below_index is None:
+        return df[CSV_COLUMNS[:7]]
+    roi, valuatie_index = _calculate_metrics(df)
+    df = df.assign(roi=roi, valuatie_index=valuatie_index)
+    return df.loc[df['valuatie_index'].to_numpy() >= drop_below_index, CSV_COLUMNS]
+
+
+def _read_csv_pyarrow(filename: str, header_names: List[str]) -> Optional[pd.DataFrame]:
+    """
+    Parse a whole CSV file with pyarrow's multithreaded reader, all columns as text.
+    
+    pandas' pyarrow engine infers column types before applying dtype, which
+    turns names like '007' into '7'; pyarrow's column_types skip the inference.
+    
+    Returns:
+        The parsed rows, or None if the file does not parse cleanly (e.g. a row
+        with too few or too many fields); pyarrow can only skip such rows, so
+        the caller re-reads the file with the C parser, which keeps them
+    """
+    try:
+        table = pa_csv.read_csv(
+            filename,
+            parse_options=pa_csv.ParseOptions(delimiter=';'),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=dict.fromkeys(header_names, pa.string()),
+                null_values=[''], strings_can_be_null=True
+            )
+        )
+    except pa.ArrowInvalid:
+        return None
+    return table.to_pandas()
+
+
+def _calculate_metrics(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate the (roi, valuatie_index) columns for the rows of df."""
+    return compute_metrics(
+        df['koers'].to_numpy(), df['winst_per_aandeel'].to_numpy(),
+        df['dividend'].to_numpy(), df['groei_percentage'].to_numpy(),
+        df['risico'].to_numpy()
+    )
+
+
+def _format_report_rows(df: pd.DataFrame) -> List[str]:
+    """Format the rows of an analyzer DataFrame as report table lines."""
+    return [_REPORT_ROW_FMT % row for row in zip(*(df[name].tolist() for name in _REPORT_COLUMNS))]
+
+
+def _to_stocks(df: pd.DataFrame) -> List[Stock]:
+    """Build Stock objects from the rows of an analyzer DataFrame."""
+    return [Stock(*row) for row in df[CSV_COLUMNS].itertuples(index=False, name=None)]
+
+
 class StockAnalyzer:
     """
     Analyzes stocks and generates filtered reports.
@@ -88,10 +233,48 @@ class StockAnalyzer:
         """
         self.min_valuation_index = min_valuation_index
         self.max_risk_score = max_risk_score
-        self.stocks: List[Stock] = []
+        self.df: pd.DataFrame = pd.DataFrame(columns=CSV_COLUMNS)
+        # Row positions sorted by valuatie_index descending, computed once per load
+        self._order: Optional[np.ndarray] = None
+        # Recent filter_indices results keyed by (min_idx, max_risk), reset on every load
+        self._filter_cache: OrderedDict[Tuple[float, float], np.ndarray] = OrderedDict()
         self.csv_filename: Optional[str] = None
     
-    def load_from_csv(self, filename: str) -> bool:
+    @property
+    def stock_count(self) -> int:
+        """Number of loaded stocks."""
+        return len(self.df)
+    
+    @property
+    def stocks(self) -> List[Stock]:
+        """Loaded stocks as Stock objects, built on demand from the DataFrame."""
+        self._ensure_metrics()
+        return _to_stocks(self.df)
+    
+    def _ensure_metrics(self) -> None:
+        """Calculate the roi and valuatie_index columns on first use after a load."""
+        if 'roi' not in self.df.columns:
+            # Added in place, so references to self.df taken earlier see the columns
+            self.df['roi'], self.df['valuatie_index'] = _calculate_metrics(self.df)
+    
+    def _ensure_order(self) -> None:
+        """Sort the rows by valuatie_index on first use after a load."""
+        if self._order is None:
+            self._ensure_metrics()
+            self._order = np.argsort(-self.df['valuatie_index'].to_numpy(), kind='stable')
+            self._order.flags.writeable = False
+    
+    def sorted_indices(self) -> np.ndarray:
+        """
+        Row positions of all loaded stocks sorted by valuation index (descending).
+        
+        The order is computed once per load and shared, so the array is read-only.
+        """
+        self._ensure_order()
+        return self._order
+    
+    def load_from_csv(self, filename: str, chunksize: Optional[int] = None,
+                      drop_below_index: Optional[float] = None) -> bool:
         """
         Load stock data from a CSV file with Dutch column names.
         
@@ -106,52 +289,64 @@ class StockAnalyzer:
         
         Args:
             filename: Path to CSV file
+            chunksize: Read the file in chunks of this many rows to bound memory
+                use on files too large to parse in one go
+            drop_below_index: Discard stocks with a lower valuation index while
+                loading, so they are never kept in memory
             
         Returns:
             True if loaded successfully, False otherwise
         """
+        self._filter_cache.clear()
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f, delimiter=';')
-                if reader.fieldnames is None:
-                    print(f"Error: CSV file '{filename}' is empty or invalid", file=sys.stderr)
-                    return False
-                
-                required_fields = {'bedrijf', 'sector', 'koers', 'winst_per_aandeel'}
-                if not required_fields.issubset(set(reader.fieldnames)):
-                    print(f"Error: CSV must contain columns: {required_fields}", file=sys.stderr)
-                    print(f"Found columns: {set(reader.fieldnames)}", file=sys.stderr)
-                    return False
-                
-                for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # Normalize whitespace in field names and values
-                        row = {k.strip(): v.strip() for k, v in row.items()}
-                        
-                        stock = Stock(
-                            bedrijf=row['bedrijf'],
-                            sector=row['sector'],
-                            koers=float(row['koers']),
-                            eps=float(row['winst_per_aandeel']),
-                            dividend=float(row.get('dividend', 0.0)),
-                            groei_percentage=float(row.get('groei_percentage', 0.0)),
-                            risico=float(row.get('risico', 1.0))
-                        )
-                        
-                        # Validate data
-                        if stock.koers <= 0:
-                            print(f"Warning: Row {row_num}: Stock '{stock.bedrijf}' has invalid price", file=sys.stderr)
-                            continue
-                        
-                        stock.calculate_metrics()
-                        self.stocks.append(stock)
-                    
-                    except (ValueError, KeyError) as e:
-                        print(f"Warning: Row {row_num}: Failed to parse stock data - {e}", file=sys.stderr)
-                        continue
+            # Validate the (whitespace-normalized) header before parsing any data
+            with open(filename, 'r', encoding='utf-8', newline='') as f:
+                # csv.reader unquotes names the way the parsers below do
+                header_names = next(csv.reader(f, delimiter=';'), [])
+            if not any(name.strip() for name in header_names):
+                print(f"Error: CSV file '{filename}' is empty or invalid", file=sys.stderr)
+                return False
+            names = [name.strip() for name in header_names]
+            
+            required_fields = {'bedrijf', 'sector', 'koers', 'winst_per_aandeel'}
+            if not set(names) >= required_fields:
+                print(f"Error: CSV must contain columns: {required_fields}", file=sys.stderr)
+                print(f"Found columns: {set(names)}", file=sys.stderr)
+                return False
             
-            return len(self.stocks) > 0
+            df = None
+            if chunksize is None and CSV_ENGINE == 'pyarrow':
+                df = _read_csv_pyarrow(filename, header_names)
+            if df is not None:
+                df = _prepare_frame(df, drop_below_index)
+            else:
+                # Every column is read as text, so names like '007' or '1.10' survive;
+                # only empty cells count as missing. Short rows are padded with empty
+                # fields and surplus fields are ignored, on every row alike (without
+                # usecols and index_col=False, a surplus field on the first data row
+                # would turn column one into the index).
+                read_options = dict(
+                    sep=';', encoding='utf-8', engine='c', dtype=str, index_col=False,
+                    usecols=range(len(header_names)),
+                    skipinitialspace=True, na_values=[''], keep_default_na=False,
+                    on_bad_lines='warn'
+                )
+                if chunksize is None:
+                    df = _prepare_frame(pd.read_csv(filename, **read_options), drop_below_index)
+                else:
+                    # The pyarrow reader cannot stream, so chunked reads use the C parser
+                    with pd.read_csv(filename, chunksize=chunksize, **read_options) as reader:
+                        frames = [_prepare_frame(chunk, drop_below_index) for chunk in reader]
+                    df = pd.concat(frames)
+            
+            self.df = df.reset_index(drop=True)
+            self._order = None
+            
+            return len(self.df) > 0
         
+        except (pd.errors.EmptyDataError, pd.errors.ParserError):
+            print(f"Error: CSV file '{filename}' is empty or invalid", file=sys.stderr)
+            return False
         except FileNotFoundError:
             print(f"Error: File '{filename}' not found", file=sys.stderr)
             return False
@@ -159,37 +354,66 @@ class StockAnalyzer:
             print(f"Error: Failed to load CSV file - {e}", file=sys.stderr)
             return False
     
-    def filter_stocks(self, 
-                     min_valuation_index: Optional[float] = None, 
-                     max_risk_score: Optional[float] = None) -> List[Stock]:
+    def filter_indices(self,
+                       min_valuation_index: Optional[float] = None,
+                       max_risk_score: Optional[float] = None) -> np.ndarray:
         """
-        Filter stocks based on criteria.
+        Filter stocks based on criteria and return their row positions.
         
         Filters by:
         - Valuation index >= min_valuation_index
         - Risk score <= max_risk_score
         
-        Results are sorted by valuation index (highest first).
+        Results are sorted by valuation index (highest first). The most
+        recently used threshold pairs are cached until the next load_from_csv call.
         
         Args:
             min_valuation_index: Override default minimum valuation index
             max_risk_score: Override default maximum risk score
             
         Returns:
-            List of filtered stocks sorted by valuation index (descending)
+            Read-only positional indices into self.df sorted by valuation index (descending)
         """
         # Support both English CLI arg names and internal Dutch names
         min_idx = min_valuation_index if min_valuation_index is not None else self.min_valuation_index
         max_risk = max_risk_score if max_risk_score is not None else self.max_risk_score
 
-        filtered = [
-            stock for stock in self.stocks
-            if stock.valuatie_index >= min_idx and stock.risico <= max_risk
-        ]
-
-        # Sort by valuatie_index descending
-        filtered.sort(key=lambda s: s.valuatie_index, reverse=True)
-        return filtered
+        key = (min_idx, max_risk)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            self._filter_cache.move_to_end(key)
+            return cached
+
+        self._ensure_order()
+        # Filter in pre-sorted order, so the result needs no sort of its own
+        order = self._order
+        mask = ((self.df['valuatie_index'].to_numpy()[order] >= min_idx)
+                & (self.df['risico'].to_numpy()[order] <= max_risk))
+        indices = order[mask]
+        # Shared between callers, so guard against in-place modification
+        indices.flags.writeable = False
+        self._filter_cache[key] = indices
+        if len(self._filter_cache) > FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+        return indices
+    
+    def filter_stocks(self, 
+                     min_valuation_index: Optional[float] = None, 
+                     max_risk_score: Optional[float] = None) -> List[Stock]:
+        """
+        Filter stocks based on criteria.
+        
+        Same selection and order as filter_indices, returned as Stock objects.
+        
+        Args:
+            min_valuation_index: Override default minimum valuation index
+            max_risk_score: Override default maximum risk score
+            
+        Returns:
+            List of filtered stocks sorted by valuation index (descending)
+        """
+        indices = self.filter_indices(min_valuation_index, max_risk_score)
+        return _to_stocks(self.df.iloc[indices])
     
     def get_statistics(self) -> Dict:
         """
@@ -198,43 +422,57 @@ class StockAnalyzer:
         Returns:
             Dictionary with statistics
         """
-        if not self.stocks:
+        n = self.stock_count
+        if n == 0:
             return {}
         
-        rois = [s.roi for s in self.stocks]
-        valuations = [s.valuation_index for s in self.stocks]
-        risks = [s.risk_score for s in self.stocks]
+        self._ensure_metrics()
+        rois = self.df['roi'].to_numpy()
+        valuations = self.df['valuatie_index'].to_numpy()
+        risks = self.df['risico'].to_numpy()
         
         return {
-            'total_stocks': len(self.stocks),
-            'avg_roi': sum(rois) / len(rois),
-            'avg_valuation': sum(valuations) / len(valuations),
-            'avg_risk': sum(risks) / len(risks),
-            'max_roi': max(rois),
-            'min_roi': min(rois),
-            'max_valuation': max(valuations),
-            'min_valuation': min(valuations),
-            'max_risk': max(risks),
-            'min_risk': min(risks)
+            'total_stocks': n,
+            'avg_roi': float(rois.mean()),
+            'avg_valuation': float(valuations.mean()),
+            'avg_risk': float(risks.mean()),
+            'max_roi': float(rois.max()),
+            'min_roi': float(rois.min()),
+            'max_valuation': float(valuations.max()),
+            'min_valuation': float(valuations.min()),
+            'max_risk': float(risks.max()),
+            'min_risk': float(risks.min())
         }
     
-    def generate_report(self, 
+    def generate_report(self,
+                       indices: Optional[np.ndarray] = None, *,
                        min_valuation_index: Optional[float] = None,
                        max_risk_score: Optional[float] = None) -> str:
         """
         Generate a formatted report of filtered stocks.
         
         Args:
+            indices: Pre-filtered result of filter_indices, used instead of
+                filtering again; the report only lists the criteria that are
+                passed along with it
             min_valuation_index: Override default minimum valuation index
             max_risk_score: Override default maximum risk score
             
         Returns:
             Report string
         """
-        min_idx = min_valuation_index if min_valuation_index is not None else self.min_valuation_index
-        max_risk = max_risk_score if max_risk_score is not None else self.max_risk_score
-        
-        filtered_stocks = self.filter_stocks(min_idx, max_risk)
+        if indices is None:
+            min_idx = min_valuation_index if min_valuation_index is not None else self.min_valuation_index
+            max_risk = max_risk_score if max_risk_score is not None else self.max_risk_score
+            indices = self.filter_indices(min_idx, max_risk)
+        elif not isinstance(indices, np.ndarray):
+            raise TypeError(f"indices must be an array from filter_indices, not "
+                            f"{type(indices).__name__}; pass thresholds as "
+                            f"min_valuation_index=/max_risk_score= keywords")
+        else:
+            # The thresholds behind precomputed indices are unknown unless given
+            min_idx, max_risk = min_valuation_index, max_risk_score
+        self._ensure_metrics()
         
         report = []
         report.append("=" * 130)
@@ -242,24 +480,19 @@ class StockAnalyzer:
         report.append("=" * 130)
         report.append("")
         report.append(f"Filter Criteria:")
-        report.append(f"  • Minimum Valuation Index: {min_idx}")
-        report.append(f"  • Maximum Risk Score:      {max_risk}")
-        report.append(f"  • Total stocks analyzed:   {len(self.stocks)}")
-        report.append(f"  • Stocks meeting criteria: {len(filtered_stocks)}")
+        if min_idx is not None:
+            report.append(f"  • Minimum Valuation Index: {min_idx}")
+        if max_risk is not None:
+            report.append(f"  • Maximum Risk Score:      {max_risk}")
+        report.append(f"  • Total stocks analyzed:   {self.stock_count}")
+        report.append(f"  • Stocks meeting criteria: {len(indices)}")
         report.append("")
         report.append("-" * 130)
-        report.append(f"{'Symbol':<8} {'Name':<30} {'Price':<10} {'EPS':<10} {'ROI %':<10} "
-                     f"{'Growth %':<10} {'Risk':<8} {'Valuation':<12}")
+        report.append(_REPORT_HEADER)
         report.append("-" * 130)
         
-        if filtered_stocks:
-            for stock in filtered_stocks:
-                report.append(
-                    f"{stock.symbol:<8} {stock.name:<30} {stock.price:<10.2f} "
-                    f"{stock.eps:<10.2f} {stock.roi:<10.2f} "
-                    f"{stock.growth_percentage:<10.2f} {stock.risk_score:<8.2f} "
-                    f"{stock.valuation_index:<12.2f}"
-                )
+        if len(indices):
+            report.extend(_format_report_rows(self.df.iloc[indices]))
         else:
             report.append("No stocks meet the specified criteria.")
         
@@ -272,31 +505,41 @@ class StockAnalyzer:
                     min_valuation_index: Optional[float] = None,
                     max_risk_score: Optional[float] = None) -> None:
         """Print the stock analysis report to console."""
-        print(self.generate_report(min_valuation_index, max_risk_score))
+        print(self.generate_report(min_valuation_index=min_valuation_index,
+                                   max_risk_score=max_risk_score))
 
-    def print_filtered_table(self, min_valuatie_index: float, max_risico: float) -> None:
+    def print_filtered_table(self, min_valuatie_index: float, max_risico: float,
+                             indices: Optional[np.ndarray] = None) -> None:
         """Print filtered stocks in the concise table format requested by the user.
 
         Columns: Bedrijf, Sector, Risico, ROI (%), Index
-        """
-        filtered = self.filter_stocks(min_valuatie_index, max_risico)
-
-        print()
-        print("{:-<60}".format(""))
-        print(f"{'Bedrijf':<15} {'Sector':<13} {'Risico':>7} {'ROI (%)':>10} {'Index':>10}")
-        print("{:-<60}".format(""))
 
-        if filtered:
-            for s in filtered:
-                print(f"{s.bedrijf:<15} {s.sector:<13} {s.risico:7.2f} {s.roi:10.2f} {s.valuatie_index:10.2f}")
+        Pass indices from filter_indices to reuse an existing filter result.
+        """
+        if indices is None:
+            indices = self.filter_indices(min_valuatie_index, max_risico)
+        self._ensure_metrics()
+
+        # Collect the table and write it with a single print call
+        table = [""]
+        table.append("{:-<60}".format(""))
+        table.append(f"{'Bedrijf':<15} {'Sector':<13} {'Risico':>7} {'ROI (%)':>10} {'Index':>10}")
+        table.append("{:-<60}".format(""))
+
+        if len(indices):
+            rows = self.df.iloc[indices][['bedrijf', 'sector', 'risico', 'roi', 'valuatie_index']]
+            for bedrijf, sector, risico, roi, valuatie_index in rows.itertuples(index=False, name=None):
+                table.append(f"{bedrijf:<15} {sector:<13} {risico:7.2f} {roi:10.2f} {valuatie_index:10.2f}")
         else:
-            print("Geen aandelen voldoen aan de opgegeven criteria.")
+            table.append("Geen aandelen voldoen aan de opgegeven criteria.")
 
-        print("{:-<60}".format(""))
+        table.append("{:-<60}".format(""))
+        print("\n".join(table))
     
     def export_to_csv(self, filename: str,
                      min_valuation_index: Optional[float] = None,
-                     max_risk_score: Optional[float] = None) -> bool:
+                     max_risk_score: Optional[float] = None,
+                     indices: Optional[np.ndarray] = None) -> bool:
         """
         Export filtered results to a CSV file.
         
@@ -304,25 +547,24 @@ class StockAnalyzer:
             filename: Output CSV file path
             min_valuation_index: Override default minimum valuation index
             max_risk_score: Override default maximum risk score
+            indices: Pre-filtered result of filter_indices; computed from the
+                criteria above if omitted
             
         Returns:
             True if exported successfully, False otherwise
         """
         try:
-            filtered_stocks = self.filter_stocks(min_valuation_index, max_risk_score)
-
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = [
-                    'bedrijf', 'sector', 'koers', 'winst_per_aandeel', 'dividend',
-                    'groei_percentage', 'risico', 'roi', 'valuatie_index'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=';')
-                writer.writeheader()
+            if indices is None:
+                indices = self.filter_indices(min_valuation_index, max_risk_score)
+            self._ensure_metrics()
 
-                for stock in filtered_stocks:
-                    writer.writerow(stock.to_dict())
+            # One-shot columnar write; '\r\n' keeps the csv module's line endings
+            self.df.iloc[indices].to_csv(
+                filename, sep=';', columns=CSV_COLUMNS, index=False,
+                float_format='%.2f', lineterminator='\r\n', encoding='utf-8'
+            )
 
-            print(f"✓ Report exported to {filename} ({len(filtered_stocks)} stocks)", file=sys.stderr)
+            print(f"✓ Report exported to {filename} ({len(indices)} stocks)", file=sys.stderr)
             return True
         
         except Exception as e:
@@ -379,6 +621,11 @@ Examples:
         action='store_true',
         help='Show statistics for all loaded stocks'
     )
+    parser.add_argument(
+        '-c', '--chunksize',
+        type=int,
+        help='Read the input CSV in chunks of this many rows (for very large files)'
+    )
     
     args = parser.parse_args()
     
@@ -389,7 +636,7 @@ Examples:
     )
     
     # Load data
-    if not analyzer.load_from_csv(args.input_csv):
+    if not analyzer.load_from_csv(args.input_csv, chunksize=args.chunksize):
         sys.exit(1)
     
     # Show statistics if requested
@@ -401,11 +648,13 @@ Examples:
     min_idx = get_float_input(f"Minimum waarderingsindex (default {args.min_index}): ", args.min_index)
     max_risk = get_float_input(f"Maximale risicoscore (default {args.max_risk}): ", args.max_risk)
 
-    analyzer.print_filtered_table(min_idx, max_risk)
+    # Filter once and share the result between the table and the export
+    indices = analyzer.filter_indices(min_idx, max_risk)
+    analyzer.print_filtered_table(min_idx, max_risk, indices)
 
     # Export if requested
     if args.output:
-        analyzer.export_to_csv(args.output, min_idx, max_risk)
+        analyzer.export_to_csv(args.output, indices=indices)
 
 
 def print_statistics(analyzer: StockAnalyzer) -> None:
@@ -477,23 +726,15 @@ def interactive_mode(analyzer: StockAnalyzer) -> None:
             
             elif user_input == 'show_all':
                 # Show all stocks without filtering
-                print("\n" + "=" * 130)
-                print("ALL LOADED STOCKS (No Filtering)")
-                print("=" * 130)
-                report = []
-                report.append(f"{'Symbol':<8} {'Name':<30} {'Price':<10} {'EPS':<10} {'ROI %':<10} "
-                             f"{'Growth %':<10} {'Risk':<8} {'Valuation':<12}")
+                report = [""]
+                report.append("=" * 130)
+                report.append("ALL LOADED STOCKS (No Filtering)")
+                report.append("=" * 130)
+                report.append(_REPORT_HEADER)
                 report.append("-" * 130)
                 
-                # Sort by valuation index
-                sorted_stocks = sorted(analyzer.stocks, key=lambda s: s.valuation_index, reverse=True)
-                for stock in sorted_stocks:
-                    report.append(
-                        f"{stock.symbol:<8} {stock.name:<30} {stock.price:<10.2f} "
-                        f"{stock.eps:<10.2f} {stock.roi:<10.2f} "
-                        f"{stock.growth_percentage:<10.2f} {stock.risk_score:<8.2f} "
-                        f"{stock.valuation_index:<12.2f}"
-                    )
+                # Sorted by valuation index via the order cached at load time
+                report.extend(_format_report_rows(analyzer.df.iloc[analyzer.sorted_indices()]))
                 report.append("-" * 130)
                 print("\n".join(report))
             
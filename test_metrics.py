@@ -0,0 +1,48 @@
+"""
+Tests for the column-wise metric calculation in _metrics.
+
+Run with: python -m pytest -q
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import _metrics
+
+COLUMNS = ('koers', 'eps', 'dividend', 'groei_percentage', 'risico')
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({name: rng.uniform(-5.0, 100.0, 1_000) for name in COLUMNS})
+    # Include the zero-division cases explicitly
+    df.loc[:9, 'koers'] = 0.0
+    df.loc[10:19, 'risico'] = 0.0
+    return df
+
+
+@pytest.mark.skipif(not _metrics.HAVE_NUMBA, reason='numba not installed')
+def test_numba_and_numpy_paths_agree(frame):
+    columns = [frame[name].to_numpy() for name in COLUMNS]
+    roi, valuatie_index = _metrics.compute_metrics(*columns)
+    expected_roi, expected_index = _metrics._compute_metrics_numpy(*columns)
+
+    np.testing.assert_array_equal(roi, expected_roi)
+    np.testing.assert_array_equal(valuatie_index, expected_index)
+
+
+@pytest.mark.skipif(not _metrics.HAVE_NUMBA, reason='numba not installed')
+def test_kernel_uses_warmed_up_signature(frame):
+    _metrics.compute_metrics(*(frame[name].to_numpy() for name in COLUMNS))
+    _metrics.compute_metrics(*(frame[name].to_numpy().copy() for name in COLUMNS))
+
+    assert len(_metrics._metrics_kernel.signatures) == 1
+
+
+def test_non_positive_price_or_risk_yields_zero(frame):
+    roi, valuatie_index = _metrics.compute_metrics(*(frame[name].to_numpy() for name in COLUMNS))
+
+    assert not roi[:10].any()
+    assert not valuatie_index[:20].any()
@@ -0,0 +1,141 @@
+"""
+Regression tests for StockAnalyzer.
+
+Run with: python -m pytest -q
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from stock_analyzer import FILTER_CACHE_SIZE, StockAnalyzer
+
+HEADER = 'bedrijf;sector;koers;winst_per_aandeel;dividend;groei_percentage;risico\n'
+
+
+def write_csv(tmp_path, rows):
+    """Write a semicolon-separated stock file with the standard header."""
+    path = tmp_path / 'aandelen.csv'
+    path.write_text(HEADER + ''.join(row + '\n' for row in rows), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('chunksize', [None, 100_000])
+def test_bad_values_in_large_file_are_rejected(tmp_path, chunksize):
+    # Enough rows for the C parser's low_memory mode to infer mixed-type columns
+    rows = [f'S{i};Tech;10;1;1;1;1' for i in range(150_000)]
+    rows += ['BADEPS;Tech;10;abc;1;1;1', 'BADRISK;Tech;10;1;1;1;x']
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(write_csv(tmp_path, rows), chunksize=chunksize)
+
+    assert analyzer.stock_count == 150_000
+    assert not analyzer.df['bedrijf'].isin(['BADEPS', 'BADRISK']).any()
+    assert all(math.isfinite(value) for value in analyzer.get_statistics().values())
+
+
+@pytest.mark.parametrize('chunksize', [None, 2])
+def test_text_columns_are_kept_verbatim(tmp_path, chunksize):
+    rows = ['007;1.10;10;1;1;1;1', '0042;2.50;5;1;;1;1', 'NA;Energie;8;1;1;1;1']
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(write_csv(tmp_path, rows), chunksize=chunksize)
+
+    assert analyzer.df['bedrijf'].tolist() == ['007', '0042', 'NA']
+    assert analyzer.df['sector'].tolist() == ['1.10', '2.50', 'Energie']
+
+
+# Without pyarrow both cases read with the C parser; the same rows must come out
+@pytest.mark.parametrize('chunksize', [None, 2])
+def test_surplus_fields_are_ignored(tmp_path, chunksize):
+    rows = ['A;Tech;10;1;1;1;1;extra', 'B;Tech;5;2;0;1;1', 'C;Tech;4;1;1;1;2;x;y']
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(write_csv(tmp_path, rows), chunksize=chunksize)
+
+    assert analyzer.df[['bedrijf', 'koers', 'winst_per_aandeel', 'risico']].values.tolist() == [
+        ['A', 10.0, 1.0, 1.0], ['B', 5.0, 2.0, 1.0], ['C', 4.0, 1.0, 2.0]
+    ]
+
+
+@pytest.mark.parametrize('chunksize', [None, 2])
+def test_short_rows_use_defaults(tmp_path, chunksize):
+    rows = ['A;Tech;10;2', 'B;Tech;5;2;0;1;3', 'C;Tech;4']
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(write_csv(tmp_path, rows), chunksize=chunksize)
+
+    # C lacks the required EPS and is rejected
+    assert analyzer.df[['bedrijf', 'dividend', 'groei_percentage', 'risico']].values.tolist() == [
+        ['A', 0.0, 0.0, 1.0], ['B', 0.0, 1.0, 3.0]
+    ]
+
+
+@pytest.mark.parametrize('chunksize', [None, 2])
+def test_quoted_header_names(tmp_path, chunksize):
+    path = tmp_path / 'aandelen.csv'
+    header = ';'.join(f'"{name}"' for name in HEADER.strip().split(';'))
+    path.write_text(header + '\nA;Tech;10;1;1;1;1\n', encoding='utf-8')
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(str(path), chunksize=chunksize)
+
+    assert analyzer.df[['bedrijf', 'koers', 'risico']].values.tolist() == [['A', 10.0, 1.0]]
+
+
+@pytest.fixture
+def loaded_analyzer(tmp_path):
+    rows = ['A;Tech;10;2;1;10;2', 'B;Tech;10;1;0;5;6', 'C;Zorg;20;1;1;2;1']
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(write_csv(tmp_path, rows))
+    return analyzer
+
+
+def test_report_from_indices_lists_only_given_criteria(loaded_analyzer):
+    indices = loaded_analyzer.filter_indices(25.0, 3.0)
+
+    report = loaded_analyzer.generate_report(indices)
+    assert 'Minimum Valuation Index' not in report
+    assert 'Maximum Risk Score' not in report
+    assert 'Stocks meeting criteria: 1' in report
+
+    report = loaded_analyzer.generate_report(indices, min_valuation_index=25.0, max_risk_score=3.0)
+    assert 'Minimum Valuation Index: 25.0' in report
+    assert 'Maximum Risk Score:      3.0' in report
+
+
+def test_report_rejects_non_array_indices(loaded_analyzer):
+    with pytest.raises(TypeError, match='min_valuation_index='):
+        loaded_analyzer.generate_report(25.0)
+
+
+def test_filter_cache_keeps_recently_used_results(loaded_analyzer):
+    first = loaded_analyzer.filter_indices(0.0, 10.0)
+    for i in range(FILTER_CACHE_SIZE):
+        loaded_analyzer.filter_indices(float(i + 1), 10.0)
+        # Using the first result keeps it from being evicted
+        assert loaded_analyzer.filter_indices(0.0, 10.0) is first
+
+    assert len(loaded_analyzer._filter_cache) == FILTER_CACHE_SIZE
+    assert (1.0, 10.0) not in loaded_analyzer._filter_cache
+
+
+def test_metrics_without_sort_order(loaded_analyzer, tmp_path):
+    loaded_analyzer.get_statistics()
+    loaded_analyzer.stocks
+    loaded_analyzer.export_to_csv(str(tmp_path / 'uit.csv'), indices=np.array([2, 0]))
+    assert loaded_analyzer._order is None
+
+    assert loaded_analyzer.sorted_indices().tolist() == [0, 2, 1]
+
+
+def test_chunked_load_drops_low_valuations_early(tmp_path):
+    # Valuation indices: A 150, B 8.33, C 20 (kept: the bound is inclusive), D 100
+    rows = ['A;Tech;10;2;1;10;2', 'B;Tech;10;1;0;5;6', 'C;Zorg;20;1;1;2;1', 'D;Zorg;10;1;1;5;1']
+    analyzer = StockAnalyzer()
+    assert analyzer.load_from_csv(write_csv(tmp_path, rows), chunksize=2, drop_below_index=20.0)
+
+    assert analyzer.df['bedrijf'].tolist() == ['A', 'C', 'D']
+    assert analyzer.df['valuatie_index'].tolist() == [150.0, 20.0, 100.0]
+    assert analyzer.sorted_indices().tolist() == [0, 2, 1]
+    assert analyzer.filter_indices(50.0, 10.0).tolist() == [0, 2]
+
+    stats = analyzer.get_statistics()
+    assert stats['total_stocks'] == 3
+    assert (stats['avg_roi'], stats['max_valuation'], stats['min_valuation']) == (20.0, 150.0, 20.0)